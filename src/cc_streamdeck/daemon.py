@@ -144,7 +144,7 @@ class Daemon:
         # Risk and instance color state
         self._settings = load_settings()
         self._risk_config: RiskConfig = load_risk_config(self._settings)
-        self._seen_pids: list[int] = []
+        self._seen_pids: dict[int, int] = {}
         # Guard time: ignore button presses for this duration after display switch
         self._display_guard_sec = self._settings.display_guard_ms / 1000.0
         self._minor_guard_sec = self._settings.display_minor_guard_ms / 1000.0
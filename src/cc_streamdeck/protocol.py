@@ -7,7 +7,7 @@ from dataclasses import asdict, dataclass, field
 from typing import Literal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PermissionChoice:
     """A single choice the user can make on the Stream Deck."""
 
@@ -16,6 +16,11 @@ class PermissionChoice:
     updated_permissions: list[dict] = field(default_factory=list)
     message: str = ""
 
+    @property
+    def is_always(self) -> bool:
+        """True for the "Always" choice (carries permission updates)."""
+        return bool(self.updated_permissions)
+
 
 @dataclass
 class PermissionRequest:
@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import threading
+from bisect import bisect_right
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from importlib.resources import files
+from itertools import accumulate
+from typing import NamedTuple
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 
 from .config import GRID_COLS, GRID_ROWS
 from .protocol import PermissionChoice, PermissionRequest
@@ -21,6 +29,19 @@ CHOICE_COLORS = {
     "open": "#3D2820",
 }
 
+
+@functools.lru_cache(maxsize=64)
+def _hex_to_rgb(color: str) -> tuple[int, int, int]:
+    """Parse a color string ("#RRGGBB" or a name) to an RGB tuple, memoized."""
+    r, g, b = ImageColor.getrgb(color)[:3]
+    return (r, g, b)
+
+
+# Label colors pre-parsed to RGB once, so per-frame fills skip hex parsing
+_PALETTE: dict[str, tuple[int, int, int]] = {
+    c: _hex_to_rgb(c) for c in (*CHOICE_COLORS.values(), "white", "#808080", "#404040")
+}
+
 # Font sizes: M PLUS 1 Code (AA) for 20/16, PixelMplus10 (dot-by-dot) for 10
 FONT_SIZE_LARGE = 20
 FONT_SIZE_MEDIUM = 16
@@ -28,6 +49,24 @@ FONT_SIZE_SMALL = 10
 
 _font_cache: dict[tuple[str, int], ImageFont.FreeTypeFont] = {}
 
+# Per-font advance widths {(weight, size): {char: width}}, seeded with
+# printable ASCII on font load and extended lazily for other characters
+_char_widths: dict[tuple[str, int], dict[str, float]] = {}
+_PRINTABLE_ASCII = "".join(chr(c) for c in range(0x20, 0x7F))
+
+# Shared ASCII advance for fonts whose printable ASCII is monospaced
+# (PixelMplus10); the M PLUS 1 Code sizes vary per glyph and are absent
+_MONO_ADVANCE: dict[tuple[str, int], float] = {}
+
+# Per-thread scratch canvas reused across renders (see _scratch_canvas)
+_scratch = threading.local()
+
+# Shared pool for building the independent per-key tiles of a render.
+# Pillow releases the GIL in its C crop/transpose/encode paths.
+_RENDER_POOL = ThreadPoolExecutor(
+    max_workers=min(6, os.cpu_count() or 2), thread_name_prefix="cc-streamdeck-render"
+)
+
 
 def load_font(weight: str = "regular", size: int = FONT_SIZE_SMALL) -> ImageFont.FreeTypeFont:
     """Load a bundled font with caching.
@@ -43,27 +82,77 @@ def load_font(weight: str = "regular", size: int = FONT_SIZE_SMALL) -> ImageFont
         else:
             font_name = f"Mplus1Code-{suffix}.ttf"
         font_path = files("cc_streamdeck.fonts").joinpath(font_name)
-        _font_cache[key] = ImageFont.truetype(str(font_path), size)
+        font = ImageFont.truetype(str(font_path), size)
+        widths = _char_widths[key] = {ch: font.getlength(ch) for ch in _PRINTABLE_ASCII}
+        if len(set(widths.values())) == 1:
+            _MONO_ADVANCE[key] = widths["M"]
+        # Rasterize ASCII once so FreeType has loaded the glyph/hinting data
+        # before the first real render
+        font.getmask(_PRINTABLE_ASCII)
+        _font_cache[key] = font
     return _font_cache[key]
 
 
-def compute_layout(
-    num_choices: int, grid_cols: int = GRID_COLS, grid_rows: int = GRID_ROWS
-) -> tuple[list[int], list[int]]:
-    """Return (message_only_keys, choice_keys) for a given number of choices.
+def _line_ends(paragraph: str, font_key: tuple[str, int], max_width: int) -> Sequence[int]:
+    """Return the end index of each line _wrap_text would cut a paragraph into.
 
-    All keys display message text. Choice keys additionally show
-    a label strip at the bottom (CHOICE_LABEL_HEIGHT pixels).
+    Glyph advances of the bundled fonts are additive, so the paragraph's
+    running widths (itertools.accumulate) can be bisected for line breaks,
+    one step per output line instead of one per character. The paragraph
+    must be non-empty; the last end may run past it for monospaced fonts.
+    """
+    mono = _MONO_ADVANCE.get(font_key)
+    if mono and paragraph.isascii() and paragraph.isprintable():
+        # Fixed advance: every line but the last holds exactly per_line chars
+        per_line = max(1, int(max_width // mono))
+        return range(per_line, len(paragraph) + per_line, per_line)
+    widths = _char_widths[font_key]
+    for char in set(paragraph).difference(widths):
+        widths[char] = load_font(*font_key).getlength(char)
+    cumulative = list(accumulate(map(widths.__getitem__, paragraph)))
+    n = len(cumulative)
+    ends = []
+    start = 0
+    base = 0.0
+    while start < n:
+        # First char past the line; a lone over-wide char still takes a line
+        end = max(bisect_right(cumulative, base + max_width, start), start + 1)
+        ends.append(end)
+        base = cumulative[end - 1]
+        start = end
+    return ends
+
+
+def _count_wrapped_lines(text: str, font_key: tuple[str, int], max_width: int) -> int:
+    """Count the lines _wrap_text would produce, using the per-font width table."""
+    load_font(*font_key)
+    return sum(
+        len(_line_ends(paragraph, font_key, max_width)) if paragraph else 1
+        for paragraph in text.split("\n")
+    )
 
-    Choice keys are placed on the bottom row, right-aligned:
-    - Allow = bottom-right (always present)
-    - Deny = left of Allow
-    - Always = between Deny and Allow (if 3 choices)
 
-    Works for any grid size (3x2 Mini, 5x3 Original, 4x2 Plus, etc.).
-    """
+def _wrap_lines(text: str, font_key: tuple[str, int], max_width: int) -> list[str]:
+    """Word-wrap text exactly like _wrap_text, using the per-font width table."""
+    load_font(*font_key)
+    lines: list[str] = []
+    for paragraph in text.split("\n"):
+        if not paragraph:
+            lines.append("")
+            continue
+        start = 0
+        for end in _line_ends(paragraph, font_key, max_width):
+            lines.append(paragraph[start:end])
+            start = end
+    return lines
+
+
+@functools.cache
+def _compute_layout_cached(
+    num_choices: int, grid_cols: int, grid_rows: int
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Memoized compute_layout returning immutable tuples (safe to share)."""
     total_keys = grid_cols * grid_rows
-    all_keys = list(range(total_keys))
 
     # Bottom-right key is always Allow
     bottom_right = total_keys - 1
@@ -73,31 +162,53 @@ def compute_layout(
         allow_key = bottom_right
         always_key = bottom_right - 1
         deny_key = bottom_right - 2
-        choice_keys = [allow_key, deny_key, always_key]
+        choice_keys = (allow_key, deny_key, always_key)
     elif num_choices == 2:
         allow_key = bottom_right
         deny_key = bottom_right - 1
-        choice_keys = [allow_key, deny_key]
+        choice_keys = (allow_key, deny_key)
     else:
-        choice_keys = [bottom_right]
+        choice_keys = (bottom_right,)
 
-    msg_keys = [k for k in all_keys if k not in choice_keys]
+    msg_keys = tuple(k for k in range(total_keys) if k not in choice_keys)
     return (msg_keys, choice_keys)
 
 
+def compute_layout(
+    num_choices: int, grid_cols: int = GRID_COLS, grid_rows: int = GRID_ROWS
+) -> tuple[list[int], list[int]]:
+    """Return (message_only_keys, choice_keys) for a given number of choices.
+
+    All keys display message text. Choice keys additionally show
+    a label strip at the bottom (CHOICE_LABEL_HEIGHT pixels).
+
+    Choice keys are placed on the bottom row, right-aligned:
+    - Allow = bottom-right (always present)
+    - Deny = left of Allow
+    - Always = between Deny and Allow (if 3 choices)
+
+    Works for any grid size (3x2 Mini, 5x3 Original, 4x2 Plus, etc.).
+    """
+    msg_keys, choice_keys = _compute_layout_cached(num_choices, grid_cols, grid_rows)
+    return (list(msg_keys), list(choice_keys))
+
+
+# tool_input field shown for well-known tools
+_TOOL_FIELDS: dict[str, str] = {
+    "Bash": "command",
+    "Write": "file_path",
+    "Edit": "file_path",
+    "Read": "file_path",
+    "Glob": "pattern",
+    "Grep": "pattern",
+    "WebFetch": "url",
+    "WebSearch": "query",
+}
+
+
 def extract_display_content(tool_name: str, tool_input: dict) -> str:
     """Extract the most relevant content from tool_input for display."""
-    field_map = {
-        "Bash": "command",
-        "Write": "file_path",
-        "Edit": "file_path",
-        "Read": "file_path",
-        "Glob": "pattern",
-        "Grep": "pattern",
-        "WebFetch": "url",
-        "WebSearch": "query",
-    }
-    field = field_map.get(tool_name)
+    field = _TOOL_FIELDS.get(tool_name)
     if field and field in tool_input:
         return str(tool_input[field])
     for v in tool_input.values():
@@ -107,31 +218,108 @@ def extract_display_content(tool_name: str, tool_input: dict) -> str:
 
 
 def _wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int) -> list[str]:
-    """Word-wrap text to fit within max_width pixels."""
+    """Word-wrap text to fit within max_width pixels.
+
+    Prefix widths only grow, so each line's length is found by bisecting
+    over font.getlength (O(log n) measurements per line, not one per char).
+    """
     lines: list[str] = []
     for paragraph in text.split("\n"):
         if not paragraph:
             lines.append("")
             continue
-        current = ""
-        for char in paragraph:
-            test = current + char
-            if font.getlength(test) > max_width:
-                if current:
-                    lines.append(current)
-                current = char
-            else:
-                current = test
-        if current:
-            lines.append(current)
+        start = 0
+        n = len(paragraph)
+        while start < n:
+            # Longest line that fits; a lone over-wide char still takes a line
+            lo, hi = start + 1, n
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if font.getlength(paragraph[start:mid]) <= max_width:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            lines.append(paragraph[start:lo])
+            start = lo
     return lines
 
 
+class _ViewportSize(NamedTuple):
+    """Pixel size of the virtual canvas spanning the whole key grid."""
+
+    width: int
+    height: int
+    tile: tuple[int, int]
+
+
+@functools.cache
+def _viewport(grid_cols: int, grid_rows: int, key_w: int, key_h: int) -> _ViewportSize:
+    """Return the (cached) virtual canvas size for a grid of key_w x key_h keys."""
+    return _ViewportSize(grid_cols * key_w, grid_rows * key_h, (key_w, key_h))
+
+
 def _key_position(key: int, grid_cols: int = GRID_COLS) -> tuple[int, int]:
     """Return (col, row) for a key index."""
     return (key % grid_cols, key // grid_cols)
 
 
+def _scratch_canvas(vw: int, vh: int, bg_color: str | None) -> Image.Image:
+    """Return this thread's reusable virtual canvas, cleared to bg_color.
+
+    With bg_color=None the previous contents are left in place for callers
+    that repaint every pixel themselves. The canvas is overwritten by the
+    next call on the same thread, so callers must finish cropping/encoding
+    before rendering again.
+    """
+    canvas = getattr(_scratch, "canvas", None)
+    if canvas is None or canvas.size != (vw, vh):
+        canvas = Image.new("RGB", (vw, vh), bg_color or "black")
+        _scratch.canvas = canvas
+    elif bg_color is not None:
+        canvas.paste(bg_color, (0, 0, vw, vh))
+    return canvas
+
+
+def _format_key(key_image_format: dict) -> tuple:
+    """Return a hashable signature of a Stream Deck key image format."""
+    return (
+        tuple(key_image_format["size"]),
+        key_image_format["format"],
+        tuple(key_image_format["flip"]),
+        key_image_format["rotation"],
+    )
+
+
+def _black_key_bytes(key_image_format: dict) -> bytes:
+    """Return the native bytes of an all-black key, encoded once per format."""
+    return _encode_solid_tile("#000000", key_image_format)
+
+
+def _encode_solid_tile(bg_color: str, key_image_format: dict) -> bytes:
+    """Return the native bytes of a key filled with bg_color, encoded once per format."""
+    return _encode_solid_tile_cached(bg_color, _format_key(key_image_format))
+
+
+def _format_from_key(fmt_key: tuple) -> dict:
+    """Rebuild a key image format dict from its _format_key signature."""
+    size, image_format, flip, rotation = fmt_key
+    return {"size": size, "format": image_format, "flip": flip, "rotation": rotation}
+
+
+@functools.lru_cache(maxsize=32)
+def _encode_solid_tile_cached(bg_color: str, fmt_key: tuple) -> bytes:
+    return pil_to_native(Image.new("RGB", fmt_key[0], bg_color), _format_from_key(fmt_key))
+
+
+def _iter_tiles(keys: Sequence[int], build: Callable[[int], bytes]) -> Iterator[tuple[int, bytes]]:
+    """Yield (key, build(key)) in key order, building tiles on the render pool.
+
+    Each build closure crops/draws, encodes and drops its PIL tile in one
+    step, so only encoded bytes outlive the worker call.
+    """
+    return zip(keys, _RENDER_POOL.map(build, keys))
+
+
 def _render_text_on_canvas(
     vw: int,
     vh: int,
@@ -144,12 +332,36 @@ def _render_text_on_canvas(
     header_fg_color: str = "#808080",
     body_fg_color: str = "white",
     header_width: int | None = None,
+    reuse: bool = False,
+    wrapped: list[str] | None = None,
 ) -> Image.Image:
-    """Render header + content text on a virtual canvas."""
-    virtual = Image.new("RGB", (vw, vh), bg_color)
-    draw = ImageDraw.Draw(virtual)
+    """Render header + content text on a virtual canvas.
+
+    With reuse=True the shared per-thread scratch canvas is returned instead
+    of a fresh image (see _scratch_canvas). wrapped takes content already
+    wrapped at font_size (see _layout_text) to skip wrapping it again.
+    """
+    # Caller colors may be user settings; parse each once per process
+    bg_rgb = _hex_to_rgb(bg_color)
+    header_bg_rgb = _hex_to_rgb(header_bg_color)
 
     header_size = FONT_SIZE_LARGE if font_size == FONT_SIZE_SMALL else font_size
+    # Header background strip (narrower when open_key occupies top-right);
+    # the strip covers the inclusive x range 0..hw
+    hw = header_width if header_width is not None else vw
+    header_box = (0, 0, min(hw + 1, vw), min(header_size, vh))
+
+    if reuse:
+        # Paint each pixel once: background around the header strip only
+        virtual = _scratch_canvas(vw, vh, None)
+        virtual.paste(bg_rgb, (header_box[2], 0, vw, header_box[3]))
+        virtual.paste(bg_rgb, (0, header_box[3], vw, vh))
+    else:
+        virtual = Image.new("RGB", (vw, vh), bg_rgb)
+    # paste(color, box) is a C fill, cheaper than ImageDraw.rectangle
+    virtual.paste(header_bg_rgb, header_box)
+    draw = ImageDraw.Draw(virtual)
+
     header_font = load_font("bold", header_size)
     font_regular = load_font("regular", font_size)
     _, header_descent = header_font.getmetrics()
@@ -158,16 +370,14 @@ def _render_text_on_canvas(
     # Shift header up by descent so text starts at pixel y=0
     y = -header_descent
 
-    # Header background strip (narrower when open_key occupies top-right)
-    hw = header_width if header_width is not None else vw
-    draw.rectangle([(0, 0), (hw, header_size - 1)], fill=header_bg_color)
-
     # Tool name header (20px when content is 10px, otherwise same as content)
-    draw.text((0, y), f" {tool_name}", font=header_font, fill=header_fg_color)
+    draw.text((0, y), f" {tool_name}", font=header_font, fill=_hex_to_rgb(header_fg_color))
     y += header_size
 
     # Content text
-    wrapped = _wrap_text(content, font_regular, vw)
+    body_fg_rgb = _hex_to_rgb(body_fg_color)
+    if wrapped is None:
+        wrapped = _wrap_lines(content, ("regular", font_size), vw)
 
     for i, line in enumerate(wrapped):
         if y + line_height > text_max_y:
@@ -176,7 +386,7 @@ def _render_text_on_canvas(
         next_overflows = y + 2 * line_height > text_max_y
         if next_overflows and i < len(wrapped) - 1:
             line = line.rstrip() + "..."
-        draw.text((0, y), line, font=font_regular, fill=body_fg_color)
+        draw.text((0, y), line, font=font_regular, fill=body_fg_rgb)
         y += line_height
 
     return virtual
@@ -192,12 +402,11 @@ def _text_fits(
     """Check if all text fits within the available area at the given font size."""
     header_size = FONT_SIZE_LARGE if font_size == FONT_SIZE_SMALL else font_size
     header_font = load_font("bold", header_size)
-    font_regular = load_font("regular", font_size)
     _, header_descent = header_font.getmetrics()
     line_height = font_size
 
-    wrapped = _wrap_text(content, font_regular, vw)
-    needed_y = -header_descent + header_size + len(wrapped) * line_height
+    num_lines = _count_wrapped_lines(content, ("regular", font_size), vw)
+    needed_y = -header_descent + header_size + num_lines * line_height
     return needed_y <= text_max_y
 
 
@@ -215,6 +424,17 @@ def _choose_font_size(
     return FONT_SIZE_SMALL
 
 
+def _layout_text(
+    vw: int,
+    text_max_y: int,
+    tool_name: str,
+    content: str,
+) -> tuple[int, list[str]]:
+    """Choose the font size and wrap content at it, measuring from the width table once."""
+    font_size = _choose_font_size(vw, text_max_y, tool_name, content)
+    return font_size, _wrap_lines(content, ("regular", font_size), vw)
+
+
 def _choice_appearance(
     choice: PermissionChoice, always_active: bool, guard_active: bool = False,
 ) -> tuple[str, str, str]:
@@ -223,34 +443,80 @@ def _choice_appearance(
     When guard_active is True, text colors are dimmed to indicate
     button presses are not yet accepted.
     """
+    return _choice_appearance_cached(
+        choice.label, choice.behavior, choice.is_always, always_active, guard_active
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _choice_appearance_cached(
+    label: str,
+    behavior: str,
+    is_always: bool,
+    always_active: bool,
+    guard_active: bool,
+) -> tuple[str, str, str]:
+    """Memoized body of _choice_appearance, keyed by the fields it depends on."""
     guard_dim = "#404040"  # Dimmed text color during guard period
-    if choice.updated_permissions:
+    if is_always:
         if always_active:
-            return (choice.label, CHOICE_COLORS["always_on"], guard_dim if guard_active else "white")
-        return (choice.label, CHOICE_COLORS["always_off"], guard_dim if guard_active else "#808080")
-    if choice.behavior == "deny":
-        return (choice.label, CHOICE_COLORS["deny"], guard_dim if guard_active else "white")
+            return (label, CHOICE_COLORS["always_on"], guard_dim if guard_active else "white")
+        return (label, CHOICE_COLORS["always_off"], guard_dim if guard_active else "#808080")
+    if behavior == "deny":
+        return (label, CHOICE_COLORS["deny"], guard_dim if guard_active else "white")
     if always_active:
-        return (choice.label, CHOICE_COLORS["allow_always"], guard_dim if guard_active else "white")
-    return (choice.label, CHOICE_COLORS["allow"], guard_dim if guard_active else "white")
+        return (label, CHOICE_COLORS["allow_always"], guard_dim if guard_active else "white")
+    return (label, CHOICE_COLORS["allow"], guard_dim if guard_active else "white")
+
+
+@functools.lru_cache(maxsize=64)
+def _label_strip(
+    label: str,
+    bg_color: str | tuple[int, int, int],
+    text_color: str | tuple[int, int, int],
+    width: int,
+    at_bottom: bool,
+) -> Image.Image | None:
+    """Render a label strip once for reuse by the overlay helpers.
+
+    Returns None when the glyphs would spill past the strip into the tile
+    body (e.g. accented capitals); callers then draw onto the tile directly.
+    Spill past the tile edge is clipped either way, so it does not count.
+    """
+    height = CHOICE_LABEL_HEIGHT if at_bottom else CHOICE_LABEL_HEIGHT + 1
+    center_y = CHOICE_LABEL_HEIGHT // 2
+    font = load_font("bold", FONT_SIZE_LARGE)
+    _, top, _, bottom = font.getbbox(label, anchor="mm")
+    if (center_y + top < 0) if at_bottom else (center_y + bottom > height):
+        return None
+    strip = Image.new("RGB", (width, height), bg_color)
+    ImageDraw.Draw(strip).text(
+        (width // 2, center_y), label, font=font, fill=text_color, anchor="mm"
+    )
+    return strip
 
 
 def _overlay_choice_label(
-    tile: Image.Image, label: str, bg_color: str, text_color: str = "white"
+    tile: Image.Image,
+    label: str,
+    bg_color: str | tuple[int, int, int],
+    text_color: str | tuple[int, int, int] = "white",
 ) -> Image.Image:
     """Overlay a colored choice label strip at the bottom of a tile."""
     tile = tile.copy()
-    draw = ImageDraw.Draw(tile)
     tw, th = tile.size
 
     y_top = th - CHOICE_LABEL_HEIGHT
-    draw.rectangle(
-        [(0, y_top), (tw, th)],
-        fill=bg_color,
-    )
+    strip = _label_strip(label, bg_color, text_color, tw, True)
+    if strip is not None:
+        tile.paste(strip, (0, y_top))
+        return tile
+
+    # paste(color, box) is a plain C fill, cheaper than ImageDraw.rectangle
+    tile.paste(bg_color, (0, y_top, tw, th))
 
     font = load_font("bold", FONT_SIZE_LARGE)
-    draw.text(
+    ImageDraw.Draw(tile).text(
         (tw // 2, y_top + CHOICE_LABEL_HEIGHT // 2),
         label,
         font=font,
@@ -261,20 +527,25 @@ def _overlay_choice_label(
 
 
 def _overlay_top_label(
-    tile: Image.Image, label: str, bg_color: str, text_color: str = "white"
+    tile: Image.Image,
+    label: str,
+    bg_color: str | tuple[int, int, int],
+    text_color: str | tuple[int, int, int] = "white",
 ) -> Image.Image:
     """Overlay a colored label strip at the top of a tile."""
     tile = tile.copy()
-    draw = ImageDraw.Draw(tile)
     tw, _ = tile.size
 
-    draw.rectangle(
-        [(0, 0), (tw, CHOICE_LABEL_HEIGHT)],
-        fill=bg_color,
-    )
+    strip = _label_strip(label, bg_color, text_color, tw, False)
+    if strip is not None:
+        tile.paste(strip, (0, 0))
+        return tile
+
+    # Same rows as the inclusive rectangle [(0, 0), (tw, CHOICE_LABEL_HEIGHT)]
+    tile.paste(bg_color, (0, 0, tw, CHOICE_LABEL_HEIGHT + 1))
 
     font = load_font("bold", FONT_SIZE_LARGE)
-    draw.text(
+    ImageDraw.Draw(tile).text(
         (tw // 2, CHOICE_LABEL_HEIGHT // 2),
         label,
         font=font,
@@ -302,17 +573,118 @@ def render_permission_request(
     All buttons display message text. Choice buttons additionally
     show a colored label strip at the bottom (CHOICE_LABEL_HEIGHT px).
 
-    Returns {key_index: native_format_bytes}.
+    Returns {key_index: native_format_bytes}. Identical requests are served
+    from an LRU cache of rendered tiles.
+    """
+    tool_name = request.tool_name
+    content = extract_display_content(tool_name, request.tool_input)
+    choices_key = tuple((c.label, c.behavior, c.is_always) for c in request.choices)
+    return dict(
+        _render_permission_request_cached(
+            tool_name,
+            content,
+            choices_key,
+            _format_key(key_image_format),
+            always_active,
+            bg_color,
+            header_bg_color,
+            header_fg_color,
+            body_fg_color,
+            grid_cols,
+            grid_rows,
+            guard_active,
+            open_key,
+        )
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _render_permission_request_cached(
+    tool_name: str,
+    content: str,
+    choices_key: tuple[tuple[str, str, bool], ...],
+    fmt_key: tuple,
+    always_active: bool,
+    bg_color: str,
+    header_bg_color: str,
+    header_fg_color: str,
+    body_fg_color: str,
+    grid_cols: int,
+    grid_rows: int,
+    guard_active: bool,
+    open_key: int | None,
+) -> dict[int, bytes]:
+    """Render a permission request from its hashable signature (callers copy the result).
+
+    Message-only tiles come from _render_permission_message, which does not
+    depend on always_active/guard_active, so toggling either only re-encodes
+    the labelled keys.
+    """
+    encode = _specialize_encoder(_format_from_key(fmt_key))
+    num_choices = len(choices_key)
+    _, choice_keys = _compute_layout_cached(num_choices, grid_cols, grid_rows)
+    message, crops = _render_permission_message(
+        tool_name,
+        content,
+        num_choices,
+        fmt_key,
+        bg_color,
+        header_bg_color,
+        header_fg_color,
+        body_fg_color,
+        grid_cols,
+        grid_rows,
+        open_key,
+    )
+
+    def build_tile(key: int) -> bytes:
+        tile = crops[key]
+        if key == open_key:
+            open_fg = _PALETTE["#404040" if guard_active else "white"]
+            tile = _overlay_top_label(tile, "Go CC", _PALETTE[CHOICE_COLORS["open"]], open_fg)
+        else:
+            label, bg_color, text_color = _choice_appearance_cached(
+                *choices_key[choice_keys.index(key)], always_active, guard_active
+            )
+            tile = _overlay_choice_label(tile, label, _PALETTE[bg_color], _PALETTE[text_color])
+        return encode(tile)
+
+    labelled = dict(_iter_tiles(tuple(crops), build_tile))
+    return {
+        key: message[key] if key in message else labelled[key]
+        for key in range(grid_cols * grid_rows)
+    }
+
+
+@functools.lru_cache(maxsize=32)
+def _render_permission_message(
+    tool_name: str,
+    content: str,
+    num_choices: int,
+    fmt_key: tuple,
+    bg_color: str,
+    header_bg_color: str,
+    header_fg_color: str,
+    body_fg_color: str,
+    grid_cols: int,
+    grid_rows: int,
+    open_key: int | None,
+) -> tuple[dict[int, bytes], dict[int, Image.Image]]:
+    """Render the message canvas of a permission request, split into keys.
+
+    Returns ({key: bytes} for message-only keys, {key: unlabelled tile} for
+    keys that get a choice or Go CC label). Both are shared through the
+    cache, so callers must not modify them (the overlay helpers copy).
     """
-    num_choices = len(request.choices)
-    _, choice_keys = compute_layout(num_choices, grid_cols, grid_rows)
+    key_image_format = _format_from_key(fmt_key)
+    encode = _specialize_encoder(key_image_format)
+    _, choice_keys = _compute_layout_cached(num_choices, grid_cols, grid_rows)
 
     # Key pixel size from format (device-dependent)
     key_w, key_h = key_image_format["size"]
 
     # Virtual canvas spans all keys (gap-free)
-    vw = grid_cols * key_w
-    vh = grid_rows * key_h
+    vw, vh, _ = _viewport(grid_cols, grid_rows, key_w, key_h)
 
     # Text must not overlap the choice label region
     if choice_keys:
@@ -321,11 +693,8 @@ def render_permission_request(
     else:
         text_max_y = vh
 
-    tool_name = request.tool_name
-    content = extract_display_content(tool_name, request.tool_input)
-
     # Adaptive font size: 20 → 16 → 10 (truncate at 10 if still overflows)
-    font_size = _choose_font_size(vw, text_max_y, tool_name, content)
+    font_size, wrapped = _layout_text(vw, text_max_y, tool_name, content)
 
     header_width = (grid_cols - 1) * key_w if open_key is not None else None
     virtual = _render_text_on_canvas(
@@ -340,30 +709,25 @@ def render_permission_request(
         header_fg_color=header_fg_color,
         body_fg_color=body_fg_color,
         header_width=header_width,
+        reuse=True,
+        wrapped=wrapped,
     )
 
-    # Split into per-key tiles and overlay choice labels
-    result: dict[int, bytes] = {}
-    for key in range(grid_cols * grid_rows):
+    def crop(key: int) -> Image.Image:
         col, row = _key_position(key, grid_cols)
         x = col * key_w
         y = row * key_h
-        tile = virtual.crop((x, y, x + key_w, y + key_h))
+        return virtual.crop((x, y, x + key_w, y + key_h))
 
-        if open_key is not None and key == open_key:
-            open_fg = "#404040" if guard_active else "white"
-            tile = _overlay_top_label(tile, "Go CC", CHOICE_COLORS["open"], open_fg)
-        elif key in choice_keys:
-            idx = choice_keys.index(key)
-            if idx < num_choices:
-                label, bg_color, text_color = _choice_appearance(
-                    request.choices[idx], always_active, guard_active
-                )
-                tile = _overlay_choice_label(tile, label, bg_color, text_color)
-
-        result[key] = pil_to_native(tile, key_image_format)
-
-    return result
+    # Split into per-key tiles (crop copies out of the scratch canvas, so it
+    # is free for reuse once all tiles are built)
+    labelled = set(choice_keys[:num_choices])
+    if open_key is not None:
+        labelled.add(open_key)
+    crops = {key: crop(key) for key in sorted(labelled)}
+    plain = tuple(k for k in range(grid_cols * grid_rows) if k not in labelled)
+    message = dict(_iter_tiles(plain, lambda key: encode(crop(key))))
+    return message, crops
 
 
 def render_fallback_message(
@@ -379,11 +743,11 @@ def render_fallback_message(
     Used for tools like ExitPlanMode that cannot be handled via the hook.
     Any button press dismisses the display.
     """
+    encode = _specialize_encoder(key_image_format)
     key_w, key_h = key_image_format["size"]
-    vw = grid_cols * key_w
-    vh = grid_rows * key_h
+    vw, vh, _ = _viewport(grid_cols, grid_rows, key_w, key_h)
 
-    virtual = Image.new("RGB", (vw, vh), bg_color)
+    virtual = _scratch_canvas(vw, vh, bg_color)
     draw = ImageDraw.Draw(virtual)
 
     header_font = load_font("bold", FONT_SIZE_LARGE)
@@ -392,7 +756,7 @@ def render_fallback_message(
 
     # Header (narrower when open_key occupies top-right)
     hw = (grid_cols - 1) * key_w if open_key is not None else vw
-    draw.rectangle([(0, 0), (hw, FONT_SIZE_LARGE - 1)], fill="#604000")
+    virtual.paste("#604000", (0, 0, min(hw + 1, vw), FONT_SIZE_LARGE))
     draw.text((0, -header_descent), f" {tool_name}", font=header_font, fill="#FFD080")
 
     # Body message
@@ -405,19 +769,18 @@ def render_fallback_message(
     ok_key = grid_cols * grid_rows - 1
 
     # Split into tiles and overlay OK label
-    result: dict[int, bytes] = {}
-    for key in range(grid_cols * grid_rows):
+    def build_tile(key: int) -> bytes:
         col, row = _key_position(key, grid_cols)
         x = col * key_w
         y = row * key_h
         tile = virtual.crop((x, y, x + key_w, y + key_h))
         if open_key is not None and key == open_key:
-            tile = _overlay_top_label(tile, "Go CC", CHOICE_COLORS["open"])
+            tile = _overlay_top_label(tile, "Go CC", _PALETTE[CHOICE_COLORS["open"]])
         elif key == ok_key:
-            tile = _overlay_choice_label(tile, "OK", "#404040")
-        result[key] = pil_to_native(tile, key_image_format)
+            tile = _overlay_choice_label(tile, "OK", _PALETTE["#404040"])
+        return encode(tile)
 
-    return result
+    return dict(_iter_tiles(range(grid_cols * grid_rows), build_tile))
 
 
 # -- AskUserQuestion rendering --
@@ -526,6 +889,7 @@ def render_ask_question_page(
     Returns:
         {key_index: native_format_bytes} for all keys.
     """
+    encode = _specialize_encoder(key_image_format)
     total_keys = grid_cols * grid_rows
     key_w, key_h = key_image_format["size"]
     key_size = (key_w, key_h)
@@ -548,16 +912,15 @@ def render_ask_question_page(
         control_key_map[cancel_key] = (control_buttons["back"], ASK_NAV_BG, ASK_CONTROL_FG, "back")
 
     # Assign options to remaining keys (left-to-right, top-to-bottom)
-    option_keys: list[int] = []
+    option_index: dict[int, int] = {}
     for key in range(total_keys):
-        if key not in control_key_map and len(option_keys) < len(options):
-            option_keys.append(key)
+        if key not in control_key_map and len(option_index) < len(options):
+            option_index[key] = len(option_index)
 
     body_h = key_h - CHOICE_LABEL_HEIGHT
     body_size = (key_w, body_h)
 
-    result: dict[int, bytes] = {}
-    for key in range(total_keys):
+    def build_tile(key: int) -> bytes:
         if key in control_key_map:
             label, ctrl_bg, ctrl_fg, role = control_key_map[key]
             is_top = (key == cancel_key)
@@ -575,8 +938,8 @@ def render_ask_question_page(
             else:
                 tile.paste(body, (0, 0))
                 tile = _overlay_choice_label(tile, label, ctrl_bg, ctrl_fg)
-        elif key in option_keys:
-            idx = option_keys.index(key)
+        elif key in option_index:
+            idx = option_index[key]
             label = options[idx]
             is_selected = label in selected
             bg = ASK_OPTION_SELECTED_BG if is_selected else ASK_OPTION_BG
@@ -585,10 +948,10 @@ def render_ask_question_page(
             tile = _render_full_button(key_size, label, bg, fg, description=desc)
         else:
             # Empty key with instance background
-            tile = Image.new("RGB", key_size, bg_color)
-        result[key] = pil_to_native(tile, key_image_format)
+            return _encode_solid_tile(bg_color, key_image_format)
+        return encode(tile)
 
-    return result
+    return dict(_iter_tiles(range(total_keys), build_tile))
 
 
 def render_notification(
@@ -604,6 +967,7 @@ def render_notification(
     Upper rows are black (blend with device bezel). Bottom row shows
     the message text across a wide horizontal canvas with instance bg color.
     """
+    encode = _specialize_encoder(key_image_format)
     key_w, key_h = key_image_format["size"]
     total_keys = grid_cols * grid_rows
 
@@ -611,7 +975,7 @@ def render_notification(
     bottom_start = (grid_rows - 1) * grid_cols
 
     # Render bottom row as a single wide canvas
-    canvas_w = grid_cols * key_w
+    canvas_w = _viewport(grid_cols, grid_rows, key_w, key_h).width
     text_color = "#606060"
 
     # OK label area on bottom-right key
@@ -649,33 +1013,132 @@ def render_notification(
         y += chosen_size
 
     # Split canvas into per-key tiles
-    result: dict[int, bytes] = {}
-    black = Image.new("RGB", (key_w, key_h), "#000000")
-    black_bytes = pil_to_native(black, key_image_format)
+    black_bytes = _black_key_bytes(key_image_format)
 
     ok_key = total_keys - 1  # bottom-right
 
-    for key in range(total_keys):
+    def build_tile(key: int) -> bytes:
         if key < bottom_start:
             if open_key is not None and key == open_key:
                 tile = Image.new("RGB", (key_w, key_h), "#000000")
-                tile = _overlay_top_label(tile, "Go CC", CHOICE_COLORS["open"])
-                result[key] = pil_to_native(tile, key_image_format)
-            else:
-                result[key] = black_bytes
-        else:
-            col = key - bottom_start
-            x = col * key_w
-            tile = canvas.crop((x, 0, x + key_w, key_h))
-            if key == ok_key:
-                tile = _overlay_choice_label(tile, "OK", "#404040")
-            result[key] = pil_to_native(tile, key_image_format)
+                tile = _overlay_top_label(tile, "Go CC", _PALETTE[CHOICE_COLORS["open"]])
+                return encode(tile)
+            return black_bytes
+        col = key - bottom_start
+        x = col * key_w
+        tile = canvas.crop((x, 0, x + key_w, key_h))
+        if key == ok_key:
+            tile = _overlay_choice_label(tile, "OK", _PALETTE["#404040"])
+        return encode(tile)
+
+    return dict(_iter_tiles(range(total_keys), build_tile))
+
+
+# Specialized native encoders per key format signature (see _specialize_encoder)
+_ENCODERS: dict[tuple, Callable[[Image.Image], bytes]] = {}
+
+# Transposes whose output swaps width and height
+_SWAPS_AXES = (
+    Image.Transpose.ROTATE_90,
+    Image.Transpose.ROTATE_270,
+    Image.Transpose.TRANSPOSE,
+    Image.Transpose.TRANSVERSE,
+)
+
+
+def _build_transpose(
+    size: tuple[int, int], flip: tuple[bool, bool], rotation: int
+) -> Image.Transpose | None:
+    """Find the single transpose equal to PILHelper's rotate + flip sequence.
+
+    Returns None for the identity. Raises ValueError if the sequence is not a
+    pure pixel permutation (e.g. a non-right-angle rotation).
+    """
+    w, h = size
+    probe = Image.frombytes(
+        "RGB", size, b"".join(bytes((i & 0xFF, i >> 8 & 0xFF, i >> 16)) for i in range(w * h))
+    )
+    target = probe
+    if rotation:
+        target = target.rotate(rotation, expand=True)
+    if flip[0]:
+        target = target.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+    if flip[1]:
+        target = target.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+    expected = (target.size, target.tobytes())
+    if expected == (probe.size, probe.tobytes()):
+        return None
+    for op in Image.Transpose:
+        candidate = probe.transpose(op)
+        if (candidate.size, candidate.tobytes()) == expected:
+            return op
+    raise ValueError(f"rotation {rotation} is not a pixel permutation")
+
+
+def _specialize_encoder(key_image_format: dict) -> Callable[[Image.Image], bytes]:
+    """Return an image -> native bytes encoder specialized for one key format.
+
+    Built once per format signature. BMP formats get a closure with the
+    transpose op, BMP header (sliced off a PILHelper-encoded probe, so output
+    stays byte-identical) and row stride pre-bound; other formats, and images
+    that don't match the key size, go through PILHelper.
+    """
+    fmt_key = _format_key(key_image_format)
+    encoder = _ENCODERS.get(fmt_key)
+    if encoder is not None:
+        return encoder
+
+    fmt = dict(key_image_format)
+
+    def generic(image: Image.Image) -> bytes:
+        return _pil_helper_to_native(image, fmt)
+
+    encoder = generic
+    if fmt["format"] == "BMP":
+        try:
+            encoder = _bmp_encoder(fmt, generic)
+        except ValueError:
+            pass  # e.g. 45-degree rotation: keep the generic encoder
+
+    _ENCODERS[fmt_key] = encoder
+    return encoder
+
+
+def _bmp_encoder(
+    fmt: dict, generic: Callable[[Image.Image], bytes]
+) -> Callable[[Image.Image], bytes]:
+    """Build the BMP fast-path encoder for fmt (see _specialize_encoder)."""
+    size = tuple(fmt["size"])
+    op = _build_transpose(size, tuple(fmt["flip"]), fmt["rotation"])
+    out_w, out_h = (size[1], size[0]) if op in _SWAPS_AXES else size
+    stride = (out_w * 3 + 3) & ~3
+    probe = _pil_helper_to_native(Image.new("RGB", size), fmt)
+    header = probe[: len(probe) - stride * out_h]
+
+    if op is None:
+
+        def encode(image: Image.Image) -> bytes:
+            if image.mode != "RGB" or image.size != size:
+                return generic(image)
+            return header + image.tobytes("raw", "BGR", stride, -1)
 
-    return result
+    else:
+
+        def encode(image: Image.Image) -> bytes:
+            if image.mode != "RGB" or image.size != size:
+                return generic(image)
+            return header + image.transpose(op).tobytes("raw", "BGR", stride, -1)
+
+    return encode
 
 
 def pil_to_native(image: Image.Image, key_image_format: dict) -> bytes:
     """Convert a PIL image to Stream Deck native format."""
+    return _specialize_encoder(key_image_format)(image)
+
+
+def _pil_helper_to_native(image: Image.Image, key_image_format: dict) -> bytes:
+    """Convert a PIL image to native format via python-elgato-streamdeck."""
     from StreamDeck.ImageHelpers import PILHelper
 
     class _FakeKey:
@@ -683,3 +1146,21 @@ def pil_to_native(image: Image.Image, key_image_format: dict) -> bytes:
             return key_image_format
 
     return PILHelper.to_native_key_format(_FakeKey(), image)
+
+
+def _warm_font_cache() -> None:
+    """Load every bundled font/size up front so the first render doesn't pay for it."""
+    for size in (FONT_SIZE_LARGE, FONT_SIZE_MEDIUM, FONT_SIZE_SMALL):
+        for weight in ("regular", "bold"):
+            load_font(weight, size)
+
+
+def _warm_layout_cache() -> None:
+    """Precompute layouts for the known deck grids (Mini, Plus/Neo, Original/MK.2, XL)."""
+    for grid_cols, grid_rows in ((3, 2), (4, 2), (5, 3), (8, 4)):
+        for num_choices in (1, 2, 3):
+            _compute_layout_cached(num_choices, grid_cols, grid_rows)
+
+
+_warm_font_cache()
+_warm_layout_cache()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import re
+import sys
 from dataclasses import dataclass, field
 from typing import Literal
 
@@ -21,7 +23,7 @@ DEFAULT_RISK_COLORS: dict[RiskLevel, tuple[str, str]] = {
 }
 
 # Default instance identification palette (body background colors)
-DEFAULT_INSTANCE_PALETTE: list[str] = [
+DEFAULT_INSTANCE_PALETTE: tuple[str, ...] = (
     "#0A0A20",  # dark navy
     "#0A200A",  # dark green
     "#200A0A",  # dark maroon
@@ -32,7 +34,7 @@ DEFAULT_INSTANCE_PALETTE: list[str] = [
     "#0A1020",  # dark steel blue
     "#1A100A",  # dark brown
     "#0A0A10",  # dark midnight
-]
+)
 
 # Default body text color
 DEFAULT_BODY_TEXT_COLOR = "white"
@@ -103,8 +105,9 @@ BUILTIN_PATH_CRITICAL: list[str] = []
 BUILTIN_PATH_HIGH: list[str] = []
 
 
+@functools.lru_cache(maxsize=1024)
 def _parse_pattern(raw: str) -> re.Pattern:
-    """Parse a pattern string into a compiled regex.
+    """Parse a pattern string into a compiled regex (memoized per raw string).
 
     Supports two modes:
     1. ``regex:...`` prefix → raw regex
@@ -131,78 +134,108 @@ def _parse_pattern(raw: str) -> re.Pattern:
     return re.compile(prefix + inner + suffix, re.IGNORECASE)
 
 
-@dataclass
+# Leading word a pattern cannot match without: an optional \b, then plain
+# word characters ending at a \b or \s (so no quantifier applies to them)
+_LEADING_WORD = re.compile(r"(?:\\b)?([A-Za-z0-9]+)(?=\\[bs]|$)")
+
+
+def _required_literal(regex_str: str) -> str:
+    """Return a lowercase word every match of regex_str contains, or "".
+
+    Only for patterns without top-level alternation (built-in rules and
+    simple-syntax user patterns); raw ``regex:`` patterns are not inspected.
+    """
+    m = _LEADING_WORD.match(regex_str)
+    return m.group(1).lower() if m else ""
+
+
+@dataclass(frozen=True, slots=True)
 class CompiledBashRule:
-    """A compiled Bash pattern rule with name and risk level."""
+    """A compiled Bash pattern rule with name and (effective) risk level.
+
+    literal, when set, is a lowercase substring the command must contain for
+    the pattern to match, checked before running the regex.
+    """
 
     name: str
     pattern: re.Pattern
     level: RiskLevel
+    literal: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RiskConfig:
-    """Loaded risk configuration (defaults + user overrides)."""
+    """Loaded risk configuration (defaults + user overrides).
+
+    Frozen so a loaded config (notably the shared default) can't be
+    reassigned; build a new one with load_risk_config instead.
+    """
 
     risk_colors: dict[RiskLevel, tuple[str, str]] = field(
         default_factory=lambda: dict(DEFAULT_RISK_COLORS)
     )
-    instance_palette: list[str] = field(default_factory=lambda: list(DEFAULT_INSTANCE_PALETTE))
+    instance_palette: tuple[str, ...] = DEFAULT_INSTANCE_PALETTE
     body_text_color: str = DEFAULT_BODY_TEXT_COLOR
     tool_risk: dict[str, str] = field(default_factory=lambda: dict(DEFAULT_TOOL_RISK))
     tool_risk_fallback: RiskLevel = DEFAULT_TOOL_RISK_FALLBACK
-    bash_rules: list[CompiledBashRule] = field(default_factory=list)
-    path_critical: list[re.Pattern] = field(default_factory=list)
-    path_high: list[re.Pattern] = field(default_factory=list)
+    bash_rules: tuple[CompiledBashRule, ...] = ()
+    path_critical: tuple[re.Pattern, ...] = ()
+    path_high: tuple[re.Pattern, ...] = ()
 
 
-def _compile_path_patterns(builtin: list[str], extra: list[str]) -> list[re.Pattern]:
-    """Compile built-in + user extra path patterns into regex objects."""
+def _compile_path_patterns(builtin: list[str], extra: list[str]) -> tuple[re.Pattern, ...]:
+    """Compile built-in + user extra path patterns into regex objects (once per config)."""
     patterns = []
     for p in builtin + extra:
         try:
             patterns.append(re.compile(p, re.IGNORECASE))
         except re.error:
             pass  # skip malformed user patterns
-    return patterns
+    return tuple(patterns)
 
 
-def _build_bash_rules(settings: UserSettings) -> list[CompiledBashRule]:
-    """Build the ordered list of compiled Bash rules.
+def _build_bash_rules(settings: UserSettings) -> tuple[CompiledBashRule, ...]:
+    """Build the ordered tuple of compiled Bash rules.
 
-    Order: prepend (user) -> built-in (with level overrides) -> append (user)
+    Order: prepend (user) -> built-in (with level overrides) -> append (user).
+    bash_levels overrides are resolved here, so matching is a single scan.
     """
     rules: list[CompiledBashRule] = []
 
     # 1. Prepend rules (user-defined, checked first)
-    _compile_user_rules(settings.bash_prepend, rules)
+    _compile_user_rules(settings.bash_prepend, settings.bash_levels, rules)
 
     # 2. Built-in rules (with level overrides from bash_levels)
     for name, regex_str, default_level in BUILTIN_BASH_RULES:
         level = settings.bash_levels.get(name, default_level)
         if level not in RISK_ORDER:
             level = default_level
+        level = sys.intern(level)
         try:
             compiled = re.compile(regex_str, re.IGNORECASE)
-            rules.append(CompiledBashRule(name=name, pattern=compiled, level=level))  # type: ignore[arg-type]
+            rules.append(
+                CompiledBashRule(
+                    name=name,
+                    pattern=compiled,
+                    level=level,  # type: ignore[arg-type]
+                    literal=_required_literal(regex_str),
+                )
+            )
         except re.error:
             pass  # should never happen for built-in patterns
 
     # 3. Append rules (user-defined, checked after built-in)
-    _compile_user_rules(settings.bash_append, rules)
-
-    # Apply bash_levels overrides to user-defined rules (prepend/append)
-    for rule in rules:
-        if rule.name in settings.bash_levels:
-            new_level = settings.bash_levels[rule.name]
-            if new_level in RISK_ORDER:
-                rule.level = new_level  # type: ignore[assignment]
+    _compile_user_rules(settings.bash_append, settings.bash_levels, rules)
 
-    return rules
+    return tuple(rules)
 
 
-def _compile_user_rules(entries: list[dict[str, str]], rules: list[CompiledBashRule]) -> None:
-    """Compile user-defined rules and append to rules list."""
+def _compile_user_rules(
+    entries: list[dict[str, str]],
+    bash_levels: dict[str, str],
+    rules: list[CompiledBashRule],
+) -> None:
+    """Compile user-defined rules (applying bash_levels overrides) and append to rules."""
     for entry in entries:
         name = entry.get("name", "")
         pattern_str = entry.get("pattern", "")
@@ -211,52 +244,76 @@ def _compile_user_rules(entries: list[dict[str, str]], rules: list[CompiledBashR
             continue
         if level not in RISK_ORDER:
             continue
+        override = bash_levels.get(name)
+        if override in RISK_ORDER:
+            level = override
+        # User strings come from TOML; intern them like the built-in literals
+        name = sys.intern(name)
+        level = sys.intern(level)
         try:
             compiled = _parse_pattern(pattern_str)
-            rules.append(CompiledBashRule(name=name, pattern=compiled, level=level))  # type: ignore[arg-type]
+            literal = (
+                "" if pattern_str.startswith("regex:") else _required_literal(compiled.pattern)
+            )
+            rules.append(
+                CompiledBashRule(
+                    name=name,
+                    pattern=compiled,
+                    level=level,  # type: ignore[arg-type]
+                    literal=literal,
+                )
+            )
         except re.error:
             pass
 
 
 def load_risk_config(settings: UserSettings | None = None) -> RiskConfig:
-    """Build RiskConfig from defaults + optional user settings."""
+    """Build RiskConfig from defaults + optional user settings.
+
+    Without settings, the default config is built once and shared between
+    callers, so it must be treated as read-only.
+    """
     if settings is None:
-        settings = UserSettings()
+        return _default_risk_config()
+    return _build_risk_config(settings)
+
+
+@functools.cache
+def _default_risk_config() -> RiskConfig:
+    return _build_risk_config(UserSettings())
 
-    config = RiskConfig()
 
+def _build_risk_config(settings: UserSettings) -> RiskConfig:
     # Merge user risk colors
+    risk_colors = dict(DEFAULT_RISK_COLORS)
     for level in ("critical", "high", "medium", "low"):
         level_key: RiskLevel = level  # type: ignore[assignment]
         if level in settings.risk_colors:
-            bg, fg = config.risk_colors[level_key]
+            bg, fg = risk_colors[level_key]
             user = settings.risk_colors[level]
             bg = user.get("bg", bg)
             fg = user.get("fg", fg)
-            config.risk_colors[level_key] = (bg, fg)
-
-    # Merge instance palette
-    if settings.instance_palette:
-        config.instance_palette = settings.instance_palette
-
-    # Merge body text color
-    if settings.body_text_color:
-        config.body_text_color = settings.body_text_color
+            risk_colors[level_key] = (bg, fg)
 
     # Merge tool risk
+    tool_risk = dict(DEFAULT_TOOL_RISK)
     for k, v in settings.tool_risk.items():
-        config.tool_risk[k] = v
+        tool_risk[sys.intern(k)] = sys.intern(v)
+    tool_risk_fallback = DEFAULT_TOOL_RISK_FALLBACK
     if settings.tool_risk_default:
-        config.tool_risk_fallback = settings.tool_risk_default  # type: ignore[assignment]
-
-    # Build bash rules
-    config.bash_rules = _build_bash_rules(settings)
-
-    # Compile path patterns
-    config.path_critical = _compile_path_patterns(BUILTIN_PATH_CRITICAL, settings.path_critical)
-    config.path_high = _compile_path_patterns(BUILTIN_PATH_HIGH, settings.path_high)
-
-    return config
+        tool_risk_fallback = sys.intern(settings.tool_risk_default)  # type: ignore[assignment]
+
+    # Fields are merged into locals above; the frozen config is built once
+    return RiskConfig(
+        risk_colors=risk_colors,
+        instance_palette=tuple(settings.instance_palette or DEFAULT_INSTANCE_PALETTE),
+        body_text_color=settings.body_text_color or DEFAULT_BODY_TEXT_COLOR,
+        tool_risk=tool_risk,
+        tool_risk_fallback=tool_risk_fallback,
+        bash_rules=_build_bash_rules(settings),
+        path_critical=_compile_path_patterns(BUILTIN_PATH_CRITICAL, settings.path_critical),
+        path_high=_compile_path_patterns(BUILTIN_PATH_HIGH, settings.path_high),
+    )
 
 
 def _max_risk(a: RiskLevel, b: RiskLevel) -> RiskLevel:
@@ -264,12 +321,17 @@ def _max_risk(a: RiskLevel, b: RiskLevel) -> RiskLevel:
     return a if RISK_ORDER[a] >= RISK_ORDER[b] else b
 
 
-def _assess_bash(command: str, config: RiskConfig) -> RiskLevel:
-    """Pattern-match a Bash command against the ordered rule list."""
+def _match_bash(command: str, config: RiskConfig) -> tuple[RiskLevel, str]:
+    """Pattern-match a Bash command against the ordered rules: (level, rule name)."""
+    # For ASCII commands str.lower agrees with re.IGNORECASE, so a rule whose
+    # required literal is absent cannot match and its regex is skipped
+    lowered = command.lower() if command.isascii() else None
     for rule in config.bash_rules:
+        if lowered is not None and rule.literal not in lowered:
+            continue
         if rule.pattern.search(command):
-            return rule.level
-    return config.tool_risk_fallback
+            return rule.level, rule.name
+    return config.tool_risk_fallback, ""
 
 
 def assess_risk_verbose(
@@ -285,11 +347,7 @@ def assess_risk_verbose(
         tool_setting = config.tool_risk_fallback
 
     if tool_setting == "evaluate":
-        command = tool_input.get("command", "")
-        for rule in config.bash_rules:
-            if rule.pattern.search(command):
-                return rule.level, rule.name
-        return config.tool_risk_fallback, ""
+        return _match_bash(tool_input.get("command", ""), config)
 
     base_level: RiskLevel = (
         tool_setting if tool_setting in RISK_ORDER else config.tool_risk_fallback
@@ -324,8 +382,9 @@ def assess_risk(tool_name: str, tool_input: dict, config: RiskConfig) -> RiskLev
     return level
 
 
-def instance_palette_index(client_pid: int, seen_pids: list[int]) -> int:
-    """Return palette index for a client_pid based on first-seen order."""
-    if client_pid not in seen_pids:
-        seen_pids.append(client_pid)
-    return seen_pids.index(client_pid)
+def instance_palette_index(client_pid: int, seen_pids: dict[int, int]) -> int:
+    """Return palette index for a client_pid based on first-seen order.
+
+    seen_pids maps each PID to its index and is extended on first sight.
+    """
+    return seen_pids.setdefault(client_pid, len(seen_pids))
@@ -20,9 +20,12 @@ def get_config_path() -> Path:
     return base / "cc-streamdeck" / "config.toml"
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSettings:
-    """Parsed user settings from config.toml."""
+    """Parsed user settings from config.toml.
+
+    Slotted but left mutable: _parse fills it in field by field.
+    """
 
     # Risk level colors (header)
     risk_colors: dict[str, dict[str, str]] = field(default_factory=dict)
@@ -66,34 +69,41 @@ def load_settings() -> UserSettings:
         return UserSettings()
 
 
+# Keys kept from each [[risk.bash.prepend]]/[[risk.bash.append]] entry
+_BASH_RULE_KEYS = ("name", "pattern", "level")
+
+
 def _parse(data: dict) -> UserSettings:
     """Parse TOML dict into UserSettings."""
+    if not data:
+        # Empty or missing config file: nothing to merge over the defaults
+        return UserSettings()
     settings = UserSettings()
 
-    # [colors.risk]
-    colors_risk = data.get("colors", {}).get("risk", {})
-    for level in ("critical", "high", "medium", "low"):
-        bg = colors_risk.get(f"{level}_bg")
-        fg = colors_risk.get(f"{level}_fg")
-        if bg or fg:
-            settings.risk_colors[level] = {}
-            if bg:
-                settings.risk_colors[level]["bg"] = bg
-            if fg:
-                settings.risk_colors[level]["fg"] = fg
+    # Look up each table once
+    colors = data.get("colors", {})
+    risk = data.get("risk", {})
+    bash = risk.get("bash", {})
+    display = data.get("display", {})
+
+    # [colors.risk]: "<level>_bg" / "<level>_fg" keys, grouped per level
+    for key, value in colors.get("risk", {}).items():
+        level, _, channel = key.rpartition("_")
+        if value and channel in ("bg", "fg") and level in ("critical", "high", "medium", "low"):
+            settings.risk_colors.setdefault(level, {})[channel] = value
 
     # [colors.instance]
-    palette = data.get("colors", {}).get("instance", {}).get("palette")
+    palette = colors.get("instance", {}).get("palette")
     if isinstance(palette, list):
         settings.instance_palette = [str(c) for c in palette]
 
     # [colors.body]
-    body_text = data.get("colors", {}).get("body", {}).get("text")
+    body_text = colors.get("body", {}).get("text")
     if body_text:
         settings.body_text_color = str(body_text)
 
     # [risk.tools]
-    risk_tools = data.get("risk", {}).get("tools", {})
+    risk_tools = risk.get("tools", {})
     for k, v in risk_tools.items():
         if k == "default":
             settings.tool_risk_default = str(v)
@@ -101,33 +111,13 @@ def _parse(data: dict) -> UserSettings:
             settings.tool_risk[k] = str(v)
 
     # [risk.bash.levels]
-    bash_levels = data.get("risk", {}).get("bash", {}).get("levels", {})
+    bash_levels = bash.get("levels", {})
     if isinstance(bash_levels, dict):
         settings.bash_levels = {str(k): str(v) for k, v in bash_levels.items()}
 
-    # [[risk.bash.prepend]]
-    bash_prepend = data.get("risk", {}).get("bash", {}).get("prepend", [])
-    if isinstance(bash_prepend, list):
-        for entry in bash_prepend:
-            if isinstance(entry, dict):
-                rule = {}
-                for key in ("name", "pattern", "level"):
-                    if key in entry:
-                        rule[key] = str(entry[key])
-                if "name" in rule and "pattern" in rule:
-                    settings.bash_prepend.append(rule)
-
-    # [[risk.bash.append]]
-    bash_append = data.get("risk", {}).get("bash", {}).get("append", [])
-    if isinstance(bash_append, list):
-        for entry in bash_append:
-            if isinstance(entry, dict):
-                rule = {}
-                for key in ("name", "pattern", "level"):
-                    if key in entry:
-                        rule[key] = str(entry[key])
-                if "name" in rule and "pattern" in rule:
-                    settings.bash_append.append(rule)
+    # [[risk.bash.prepend]] / [[risk.bash.append]]
+    settings.bash_prepend = _parse_bash_rules(bash.get("prepend", []))
+    settings.bash_append = _parse_bash_rules(bash.get("append", []))
 
     # [notification]
     notif_types = data.get("notification", {}).get("types")
@@ -135,13 +125,13 @@ def _parse(data: dict) -> UserSettings:
         settings.notification_types = [str(t) for t in notif_types]
 
     # [display]
-    guard_ms = data.get("display", {}).get("guard_ms")
+    guard_ms = display.get("guard_ms")
     if isinstance(guard_ms, int):
         settings.display_guard_ms = max(0, guard_ms)
-    minor_guard_ms = data.get("display", {}).get("minor_guard_ms")
+    minor_guard_ms = display.get("minor_guard_ms")
     if isinstance(minor_guard_ms, int):
         settings.display_minor_guard_ms = max(0, minor_guard_ms)
-    guard_dim = data.get("display", {}).get("guard_dim")
+    guard_dim = display.get("guard_dim")
     if isinstance(guard_dim, bool):
         settings.display_guard_dim = guard_dim
 
@@ -150,8 +140,22 @@ def _parse(data: dict) -> UserSettings:
         ("path_critical", "path_critical"),
         ("path_high", "path_high"),
     ]:
-        patterns = data.get("risk", {}).get(level, {}).get("patterns", [])
+        patterns = risk.get(level, {}).get("patterns", [])
         if isinstance(patterns, list):
             setattr(settings, attr, [str(p) for p in patterns])
 
     return settings
+
+
+def _parse_bash_rules(entries: object) -> list[dict[str, str]]:
+    """Parse a [[risk.bash.prepend]]/[[risk.bash.append]] array of tables.
+
+    Entries without a name and pattern are skipped before any copying.
+    """
+    if not isinstance(entries, list):
+        return []
+    return [
+        {key: str(entry[key]) for key in _BASH_RULE_KEYS if key in entry}
+        for entry in entries
+        if isinstance(entry, dict) and "name" in entry and "pattern" in entry
+    ]
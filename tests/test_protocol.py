@@ -38,6 +38,20 @@ class TestPermissionRequest:
         assert data.count(b"\n") == 1
 
 
+class TestPermissionChoice:
+    def test_is_always(self, sample_request):
+        assert [c.is_always for c in sample_request.choices] == [False, False, True]
+
+    def test_frozen(self):
+        import dataclasses
+
+        import pytest
+
+        choice = PermissionChoice(label="Allow", behavior="allow")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            choice.label = "Deny"  # type: ignore[misc]
+
+
 class TestPermissionResponse:
     def test_round_trip_ok(self):
         choice = PermissionChoice(label="Allow", behavior="allow")
@@ -1,18 +1,24 @@
 """Tests for renderer module."""
 
 from cc_streamdeck.config import GRID_COLS, GRID_ROWS, KEY_PIXEL_SIZE
-from cc_streamdeck.protocol import PermissionChoice
+from cc_streamdeck.protocol import PermissionChoice, PermissionRequest
 from cc_streamdeck.renderer import (
+    _MONO_ADVANCE,
     CHOICE_LABEL_HEIGHT,
     FONT_SIZE_LARGE,
     FONT_SIZE_MEDIUM,
     FONT_SIZE_SMALL,
     _choice_appearance,
     _choose_font_size,
+    _count_wrapped_lines,
+    _hex_to_rgb,
+    _label_strip,
+    _layout_text,
     _overlay_choice_label,
     _overlay_top_label,
     _render_text_on_canvas,
     _text_fits,
+    _wrap_text,
     compute_layout,
     extract_display_content,
     load_font,
@@ -72,6 +78,20 @@ class TestComputeLayout:
         assert choice_keys == [31, 29, 30]
         assert sorted(msg_keys + choice_keys) == list(range(32))
 
+    def test_known_grids_precomputed(self):
+        from cc_streamdeck.renderer import _compute_layout_cached
+
+        before = _compute_layout_cached.cache_info()
+        compute_layout(2, grid_cols=5, grid_rows=3)
+        after = _compute_layout_cached.cache_info()
+        assert after.misses == before.misses
+        assert after.hits == before.hits + 1
+
+    def test_results_are_independent_lists(self):
+        msg_keys, _ = compute_layout(3)
+        msg_keys.append(99)
+        assert compute_layout(3)[0] == [0, 1, 2]
+
 
 class TestExtractDisplayContent:
     def test_bash_command(self):
@@ -90,6 +110,16 @@ class TestExtractDisplayContent:
     def test_empty_input(self):
         assert extract_display_content("Bash", {}) == ""
 
+    def test_keeps_value_types(self):
+        assert extract_display_content("Custom", {"n": 1}) == "{'n': 1}"
+        assert extract_display_content("Custom", {"n": True}) == "{'n': True}"
+        assert extract_display_content("Custom", {"x": 0.0}) == "{'x': 0.0}"
+        assert extract_display_content("Custom", {"x": -0.0}) == "{'x': -0.0}"
+
+    def test_unhashable_input(self):
+        tool_input = {"allowedPrompts": [{"tool": "Bash"}]}
+        assert extract_display_content("ExitPlanMode", tool_input) == str(tool_input)
+
 
 class TestLoadFont:
     def test_pixelmplus_regular(self):
@@ -122,6 +152,11 @@ class TestLoadFont:
         large = load_font("regular", FONT_SIZE_LARGE)
         assert small is not large
 
+    def test_prewarmed_ascii(self):
+        for size in (FONT_SIZE_SMALL, FONT_SIZE_MEDIUM, FONT_SIZE_LARGE):
+            mask = load_font("regular", size).getmask("A")
+            assert mask.size[0] > 0 and mask.size[1] > 0
+
 
 class TestTextFits:
     def test_short_text_fits_large(self):
@@ -141,6 +176,59 @@ class TestTextFits:
         assert _text_fits(vw, text_max_y, "Bash", "ls -la", FONT_SIZE_MEDIUM)
 
 
+def _wrap_text_linear(text, font, max_width):
+    """Reference wrap: grow each line one character at a time."""
+    lines = []
+    for paragraph in text.split("\n"):
+        if not paragraph:
+            lines.append("")
+            continue
+        current = ""
+        for char in paragraph:
+            if font.getlength(current + char) > max_width:
+                if current:
+                    lines.append(current)
+                current = char
+            else:
+                current += char
+        lines.append(current)
+    return lines
+
+
+class TestWrapText:
+    def test_binary_search_matches_linear(self):
+        import random
+
+        rng = random.Random(0)
+        alphabet = "abcdefgWM .-/_$\n日本語"
+        for _ in range(100):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+            for size in (FONT_SIZE_LARGE, FONT_SIZE_SMALL):
+                font = load_font("regular", size)
+                for width in (5, 60, GRID_COLS * KEY_PIXEL_SIZE[0]):
+                    assert _wrap_text(text, font, width) == _wrap_text_linear(text, font, width)
+
+
+class TestCountWrappedLines:
+    def test_matches_wrap_text(self):
+        vw = GRID_COLS * KEY_PIXEL_SIZE[0]
+        texts = ["", "ls", "a" * 120, "line1\n\nline3", "/usr/bin:$PATH 日本語テスト" * 5]
+        for size in (FONT_SIZE_LARGE, FONT_SIZE_MEDIUM, FONT_SIZE_SMALL):
+            font = load_font("regular", size)
+            for text in texts:
+                expected = len(_wrap_text(text, font, vw))
+                assert _count_wrapped_lines(text, ("regular", size), vw) == expected
+
+    def test_monospace_ascii_matches_wrap_text(self):
+        assert ("regular", FONT_SIZE_SMALL) in _MONO_ADVANCE
+        assert ("regular", FONT_SIZE_LARGE) not in _MONO_ADVANCE
+        font = load_font("regular", FONT_SIZE_SMALL)
+        for width in (3, 50, 101, GRID_COLS * KEY_PIXEL_SIZE[0]):
+            for text in ("x", "ab cd/ef" * 40, "one\n" + "z" * 299 + "\n\tTab"):
+                expected = len(_wrap_text(text, font, width))
+                assert _count_wrapped_lines(text, ("regular", FONT_SIZE_SMALL), width) == expected
+
+
 class TestChooseFontSize:
     def test_short_text_gets_large(self):
         vw = GRID_COLS * KEY_PIXEL_SIZE[0]
@@ -163,6 +251,31 @@ class TestChooseFontSize:
         assert _choose_font_size(vw, text_max_y, "Bash", long_text) == FONT_SIZE_SMALL
 
 
+class TestLayoutText:
+    def test_layout_text_single_measurement(self, monkeypatch):
+        from PIL import ImageFont
+
+        vw = GRID_COLS * KEY_PIXEL_SIZE[0]
+        vh = GRID_ROWS * KEY_PIXEL_SIZE[1]
+        text_max_y = vh - CHOICE_LABEL_HEIGHT
+        content = "npm run build -- --watch " * 12
+        expected = _choose_font_size(vw, text_max_y, "Bash", content)
+
+        calls = []
+        original = ImageFont.FreeTypeFont.getlength
+        monkeypatch.setattr(
+            ImageFont.FreeTypeFont,
+            "getlength",
+            lambda self, *args, **kwargs: calls.append(args) or original(self, *args, **kwargs),
+        )
+        size, wrapped = _layout_text(vw, text_max_y, "Bash", content)
+        _render_text_on_canvas(vw, vh, text_max_y, "Bash", content, size, wrapped=wrapped)
+        # Widths come from the per-font table filled at load time
+        assert calls == []
+        assert size == expected
+        assert wrapped == _wrap_text(content, load_font("regular", size), vw)
+
+
 class TestRenderTextOnCanvas:
     def test_canvas_size(self):
         vw = GRID_COLS * KEY_PIXEL_SIZE[0]
@@ -170,6 +283,66 @@ class TestRenderTextOnCanvas:
         img = _render_text_on_canvas(vw, vh, vh, "Bash", "ls -la", FONT_SIZE_LARGE)
         assert img.size == (vw, vh)
 
+    def test_reuse_returns_cleared_scratch_canvas(self):
+        vw = GRID_COLS * KEY_PIXEL_SIZE[0]
+        vh = GRID_ROWS * KEY_PIXEL_SIZE[1]
+        first = _render_text_on_canvas(
+            vw, vh, vh, "Bash", "x" * 200, FONT_SIZE_SMALL, reuse=True,
+        )
+        fresh = _render_text_on_canvas(vw, vh, vh, "Bash", "ls", FONT_SIZE_LARGE)
+        second = _render_text_on_canvas(vw, vh, vh, "Bash", "ls", FONT_SIZE_LARGE, reuse=True)
+        assert second is first
+        assert fresh is not second
+        # Previous content is wiped before drawing again
+        assert second.tobytes() == fresh.tobytes()
+
+    def test_reuse_with_narrow_header_matches_fresh(self):
+        vw = GRID_COLS * KEY_PIXEL_SIZE[0]
+        vh = GRID_ROWS * KEY_PIXEL_SIZE[1]
+        hw = (GRID_COLS - 1) * KEY_PIXEL_SIZE[0]
+        _render_text_on_canvas(vw, vh, vh, "Bash", "x" * 200, FONT_SIZE_SMALL, reuse=True)
+        fresh = _render_text_on_canvas(vw, vh, vh, "Bash", "ls", FONT_SIZE_LARGE, header_width=hw)
+        reused = _render_text_on_canvas(
+            vw, vh, vh, "Bash", "ls", FONT_SIZE_LARGE, header_width=hw, reuse=True,
+        )
+        assert reused.tobytes() == fresh.tobytes()
+
+    def test_scratch_thread_isolated(self):
+        import threading
+
+        vw = GRID_COLS * KEY_PIXEL_SIZE[0]
+        vh = GRID_ROWS * KEY_PIXEL_SIZE[1]
+        barrier = threading.Barrier(2)
+        results = {}
+
+        def render(name, content):
+            first = _render_text_on_canvas(
+                vw, vh, vh, "Bash", content, FONT_SIZE_LARGE, reuse=True,
+            )
+            snapshot = first.tobytes()
+            # Both threads have drawn before either checks its canvas
+            barrier.wait()
+            again = _render_text_on_canvas(
+                vw, vh, vh, "Bash", content, FONT_SIZE_LARGE, reuse=True,
+            )
+            results[name] = (first, snapshot, again is first)
+
+        threads = [
+            threading.Thread(target=render, args=("a", "ls")),
+            threading.Thread(target=render, args=("b", "rm -rf /tmp/x")),
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        (canvas_a, snap_a, same_a), (canvas_b, snap_b, same_b) = results["a"], results["b"]
+        assert canvas_a is not canvas_b
+        assert same_a and same_b
+        assert canvas_a.tobytes() == snap_a
+        assert canvas_b.tobytes() == snap_b
+        assert snap_a != snap_b
+
     def test_has_content(self):
         vw = GRID_COLS * KEY_PIXEL_SIZE[0]
         vh = GRID_ROWS * KEY_PIXEL_SIZE[1]
@@ -258,6 +431,15 @@ class TestChoiceAppearance:
         assert text_color == "white"
 
 
+class TestHexToRgb:
+    def test_hex_and_named_colors(self):
+        assert _hex_to_rgb("#0050D0") == (0x00, 0x50, 0xD0)
+        assert _hex_to_rgb("white") == (255, 255, 255)
+
+    def test_memoized(self):
+        assert _hex_to_rgb("#3D2820") is _hex_to_rgb("#3D2820")
+
+
 class TestOverlayChoiceLabel:
     def test_returns_correct_size(self):
         from PIL import Image
@@ -286,6 +468,19 @@ class TestOverlayChoiceLabel:
         extrema = bottom.getextrema()
         assert any(ch[1] > 0 for ch in extrema)
 
+    def test_label_strip_rendered_once(self):
+        strip = _label_strip("Allow", "#005000", "white", KEY_PIXEL_SIZE[0], True)
+        assert strip is not None
+        assert _label_strip("Allow", "#005000", "white", KEY_PIXEL_SIZE[0], True) is strip
+
+    def test_tall_glyphs_skip_cached_strip(self):
+        from PIL import Image
+
+        assert _label_strip("Ájg", "#005000", "white", KEY_PIXEL_SIZE[0], True) is None
+        tile = Image.new("RGB", KEY_PIXEL_SIZE, "black")
+        result = _overlay_choice_label(tile, "Ájg", "#005000")
+        assert result.size == KEY_PIXEL_SIZE
+
 
 class TestOverlayTopLabel:
     def test_returns_correct_size(self):
@@ -376,6 +571,43 @@ class TestRenderPermissionRequest:
         result = render_permission_request(two_choice_request, self.MOCK_FORMAT)
         assert set(result.keys()) == {0, 1, 2, 3, 4, 5}
 
+    def test_parallel_tiles_match_serial(self, sample_request, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from cc_streamdeck import renderer
+
+        requests = [
+            PermissionRequest(
+                tool_name="Bash",
+                tool_input={"command": f"echo {i} " + "x" * (i * 15)},
+                choices=sample_request.choices,
+            )
+            for i in range(20)
+        ]
+
+        def render_all():
+            renderer._render_permission_request_cached.cache_clear()
+            renderer._render_permission_message.cache_clear()
+            with ThreadPoolExecutor(max_workers=4) as callers:
+                return list(callers.map(
+                    lambda r: renderer.render_permission_request(r, self.MOCK_FORMAT), requests
+                ))
+
+        parallel = render_all()
+        monkeypatch.setattr(
+            renderer, "_iter_tiles", lambda keys, build: ((k, build(k)) for k in keys)
+        )
+        assert render_all() == parallel
+
+    def test_repeat_call_returns_same_bytes(self, sample_request):
+        from cc_streamdeck.renderer import render_permission_request
+
+        first = render_permission_request(sample_request, self.MOCK_FORMAT)
+        second = render_permission_request(sample_request, self.MOCK_FORMAT)
+        assert first is not second
+        for key, value in first.items():
+            assert second[key] is value
+
     def test_always_active_renders(self, sample_request):
         from cc_streamdeck.renderer import render_permission_request
 
@@ -384,6 +616,13 @@ class TestRenderPermissionRequest:
         for v in result.values():
             assert isinstance(v, bytes)
 
+        # Toggling Always only re-encodes the labelled keys
+        inactive = render_permission_request(sample_request, self.MOCK_FORMAT)
+        for key in (0, 1, 2):
+            assert result[key] is inactive[key]
+        assert result[4] != inactive[4]
+        assert result[5] != inactive[5]
+
     def test_open_key_overlay(self, sample_request):
         """open_key adds a 'Go CC' top label overlay on the top-right key."""
         from cc_streamdeck.renderer import render_permission_request
@@ -538,6 +777,19 @@ class TestRenderAskQuestionPage:
         for v in result.values():
             assert isinstance(v, bytes)
 
+    def test_empty_keys_reuse_cached_bytes(self):
+        from cc_streamdeck.renderer import render_ask_question_page
+
+        # 1 option + 2 controls on 3x2 leaves keys 1, 3, 4 empty
+        result = render_ask_question_page(
+            options=["A"],
+            selected=set(),
+            control_buttons={"cancel": "Cancel", "submit": "Submit"},
+            key_image_format=self.MOCK_FORMAT,
+            bg_color="#0A200A",
+        )
+        assert result[1] is result[3] is result[4]
+
     def test_page_info_on_cancel_key(self):
         """page_info is rendered in the body area of the cancel/back control key."""
         from cc_streamdeck.renderer import render_ask_question_page
@@ -637,6 +889,14 @@ class TestRenderNotification:
         result = render_notification("Test", self.MOCK_FORMAT)
         assert result[0] == result[1] == result[2]
 
+    def test_black_keys_reuse_cached_bytes(self):
+        from cc_streamdeck.renderer import render_notification
+
+        first = render_notification("Test", self.MOCK_FORMAT)
+        second = render_notification("Other", self.MOCK_FORMAT)
+        assert first[0] is first[1]
+        assert first[0] is second[0]
+
     def test_custom_grid(self):
         from cc_streamdeck.renderer import render_notification
 
@@ -666,6 +926,37 @@ class TestRenderNotification:
         assert without[5] == with_open[5]
 
 
+class TestPilToNative:
+    def _noise(self, size):
+        import random
+
+        from PIL import Image
+
+        rng = random.Random(0)
+        data = bytes(rng.randrange(256) for _ in range(size[0] * size[1] * 3))
+        return Image.frombytes("RGB", size, data)
+
+    def test_bmp_fast_path_matches_pilhelper(self):
+        from cc_streamdeck.renderer import _pil_helper_to_native, pil_to_native
+
+        formats = [
+            {"size": (80, 80), "format": "BMP", "flip": (False, True), "rotation": 90},
+            {"size": (72, 72), "format": "BMP", "flip": (True, True), "rotation": 0},
+            {"size": (80, 80), "format": "BMP", "flip": (False, False), "rotation": 0},
+            {"size": (70, 50), "format": "BMP", "flip": (True, False), "rotation": 270},
+        ]
+        for fmt in formats:
+            img = self._noise(fmt["size"])
+            assert pil_to_native(img, fmt) == _pil_helper_to_native(img, fmt)
+
+    def test_non_bmp_uses_pilhelper(self):
+        from cc_streamdeck.renderer import _pil_helper_to_native, pil_to_native
+
+        fmt = {"size": (72, 72), "format": "JPEG", "flip": (True, True), "rotation": 0}
+        img = self._noise(fmt["size"])
+        assert pil_to_native(img, fmt) == _pil_helper_to_native(img, fmt)
+
+
 class TestTruncation:
     def test_overflow_text_still_renders(self):
         """Even very long text should render without error."""
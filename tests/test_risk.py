@@ -1,7 +1,10 @@
 """Tests for risk assessment module."""
 
+import pytest
+
 from cc_streamdeck.risk import (
     _parse_pattern,
+    _required_literal,
     assess_risk,
     assess_risk_verbose,
     instance_palette_index,
@@ -267,6 +270,22 @@ class TestPathElevation:
         # Edit defaults to medium, but /etc/ elevates to high
         assert assess_risk("Edit", {"file_path": "/etc/hosts"}, config) == "high"
 
+    def test_patterns_compiled_once(self, monkeypatch):
+        import re
+
+        settings = UserSettings(path_critical=[r"\.env$"], path_high=[r"/etc/", r"("])
+        config = load_risk_config(settings)
+        assert len(config.path_critical) == 1
+        assert len(config.path_high) == 1  # malformed pattern skipped
+        assert all(isinstance(p, re.Pattern) for p in config.path_critical + config.path_high)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("re.compile called while assessing")
+
+        monkeypatch.setattr(re, "compile", fail)
+        assert assess_risk("Write", {"file_path": "/app/.env"}, config) == "critical"
+        assert assess_risk("Edit", {"file_path": "/etc/hosts"}, config) == "high"
+
     def test_elevation_does_not_lower(self):
         settings = UserSettings(path_high=[r"\.txt$"])
         config = load_risk_config(settings)
@@ -283,6 +302,17 @@ class TestRiskConfigMerge:
         assert len(config.instance_palette) == 10
         assert config.body_text_color == "white"
 
+    def test_default_config_built_once(self):
+        assert load_risk_config() is load_risk_config()
+        assert load_risk_config(UserSettings()) is not load_risk_config()
+
+    def test_config_is_frozen(self):
+        import dataclasses
+
+        config = load_risk_config()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.body_text_color = "red"  # type: ignore[misc]
+
     def test_user_color_override(self):
         settings = UserSettings(risk_colors={"critical": {"bg": "#FF0000"}})
         config = load_risk_config(settings)
@@ -293,7 +323,25 @@ class TestRiskConfigMerge:
     def test_user_palette_override(self):
         settings = UserSettings(instance_palette=["#111", "#222"])
         config = load_risk_config(settings)
-        assert config.instance_palette == ["#111", "#222"]
+        assert config.instance_palette == ("#111", "#222")
+        # Stored as a copy, so later edits to the settings don't leak in
+        settings.instance_palette.append("#333")
+        assert config.instance_palette == ("#111", "#222")
+
+    def test_user_strings_interned(self):
+        import sys
+
+        # Decoded at runtime like TOML values, so not interned
+        level = b"critical".decode()
+        settings = UserSettings(
+            bash_prepend=[{"name": b"my-rule".decode(), "pattern": "foo", "level": level}],
+            tool_risk={"Write": level},
+        )
+        config = load_risk_config(settings)
+        rule = config.bash_rules[0]
+        assert rule.level is sys.intern("critical")
+        assert rule.name is sys.intern("my-rule")
+        assert config.tool_risk["Write"] is sys.intern("critical")
 
     def test_user_tool_risk_override(self):
         settings = UserSettings(tool_risk={"Write": "critical"})
@@ -303,23 +351,24 @@ class TestRiskConfigMerge:
 
 class TestInstancePaletteIndex:
     def test_first_pid(self):
-        seen: list[int] = []
+        seen: dict[int, int] = {}
         assert instance_palette_index(1234, seen) == 0
-        assert seen == [1234]
+        assert seen == {1234: 0}
 
     def test_second_pid(self):
-        seen: list[int] = [1234]
+        seen: dict[int, int] = {1234: 0}
         assert instance_palette_index(5678, seen) == 1
-        assert seen == [1234, 5678]
+        assert seen == {1234: 0, 5678: 1}
 
     def test_returning_pid(self):
-        seen: list[int] = [1234, 5678]
+        seen: dict[int, int] = {1234: 0, 5678: 1}
         assert instance_palette_index(1234, seen) == 0
+        assert list(seen) == [1234, 5678]
 
     def test_wraps_around_palette(self):
         config = load_risk_config()
         palette_size = len(config.instance_palette)
-        seen: list[int] = list(range(palette_size + 2))
+        seen: dict[int, int] = {pid: pid for pid in range(palette_size + 2)}
         idx = instance_palette_index(palette_size + 1, seen)
         assert idx == palette_size + 1
         # Modulo wrapping happens at usage site
@@ -368,6 +417,44 @@ class TestSimplePattern:
         assert pat.search("my-tool.exe --flag")
         assert not pat.search("my-toolXexe")  # . should be literal
 
+    def test_cached_per_raw_string(self):
+        assert _parse_pattern("git push") is _parse_pattern("git push")
+        assert _parse_pattern("git push") is not _parse_pattern("git pull")
+
+
+class TestRequiredLiteral:
+    """Test the literal prefilter that skips regexes which cannot match."""
+
+    def test_leading_word(self):
+        assert _required_literal(r"\bgit\s+push\b") == "git"
+        assert _required_literal(r"DROP\s+(TABLE|DATABASE)") == "drop"
+        assert _required_literal(_parse_pattern("rm -rf /tmp/*").pattern) == "rm"
+
+    def test_no_literal(self):
+        assert _required_literal(r"^\s*(ls|cat)\b") == ""
+        assert _required_literal(r"\b(shutdown|reboot)\b") == ""
+        # Quantified or wildcard-continued words are not required as a whole
+        assert _required_literal(_parse_pattern("foo*").pattern) == ""
+        assert _required_literal(_parse_pattern("*foo").pattern) == ""
+
+    def test_raw_regex_rules_always_searched(self):
+        settings = UserSettings(
+            bash_prepend=[{"name": "either", "pattern": r"regex:\bcurl\b|wget", "level": "low"}]
+        )
+        config = load_risk_config(settings)
+        assert config.bash_rules[0].literal == ""
+        assert assess_risk_verbose("Bash", {"command": "wget x"}, config) == ("low", "either")
+
+    def test_case_insensitive(self):
+        config = load_risk_config()
+        assert assess_risk("Bash", {"command": "SUDO ls"}, config) == "critical"
+
+    def test_non_ascii_command(self):
+        config = load_risk_config()
+        # Non-ASCII commands skip the prefilter (str.lower != re.IGNORECASE)
+        assert assess_risk("Bash", {"command": "echo 日本語 && sudo ls"}, config) == "critical"
+        assert assess_risk("Bash", {"command": "\u017fudo ls"}, config) == "critical"
+
 
 class TestBashLevelsOverride:
     """Test bash_levels overrides for named rules."""
@@ -31,6 +31,9 @@ class TestParse:
     def test_empty_dict(self):
         settings = _parse({})
         assert isinstance(settings, UserSettings)
+        assert settings == UserSettings()
+        # Each call gets its own (mutable) defaults
+        assert _parse({}).notification_types is not settings.notification_types
 
     def test_risk_colors(self):
         data = {
@@ -48,6 +51,11 @@ class TestParse:
         assert settings.risk_colors["low"]["bg"] == "#000000"
         assert "fg" not in settings.risk_colors["low"]
 
+    def test_risk_colors_ignores_unknown_and_empty(self):
+        data = {"colors": {"risk": {"extreme_bg": "#FF0000", "high_fg": "", "medium_xx": "#1"}}}
+        settings = _parse(data)
+        assert settings.risk_colors == {}
+
     def test_instance_palette(self):
         data = {"colors": {"instance": {"palette": ["#111", "#222", "#333"]}}}
         settings = _parse(data)
@@ -143,6 +151,11 @@ class TestParseBashRules:
         assert len(settings.bash_prepend) == 1
         assert settings.bash_prepend[0]["name"] == "valid"
 
+    def test_bash_rule_keeps_known_keys_as_str(self):
+        data = {"risk": {"bash": {"append": [{"name": "n", "pattern": 1, "note": "x"}]}}}
+        settings = _parse(data)
+        assert settings.bash_append == [{"name": "n", "pattern": "1"}]
+
     def test_empty_bash_section(self):
         data = {"risk": {"bash": {}}}
         settings = _parse(data)